@@ -7,11 +7,13 @@ from .runner import run, run_once
 # Client (for enqueuing tasks)
 from .client import (
     RunqyClient,
+    AsyncRunqyClient,
     TaskInfo,
     RunqyError,
     AuthenticationError,
     TaskNotFoundError,
     enqueue,
+    invalidate_cached_clients,
 )
 
 __all__ = [
@@ -22,11 +24,13 @@ __all__ = [
     "run_once",
     # Client
     "RunqyClient",
+    "AsyncRunqyClient",
     "TaskInfo",
     "RunqyError",
     "AuthenticationError",
     "TaskNotFoundError",
     "enqueue",
+    "invalidate_cached_clients",
 ]
 
 __version__ = "0.2.0"
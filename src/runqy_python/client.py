@@ -1,15 +1,217 @@
 """Client for enqueuing tasks to runqy server."""
 
+import asyncio
+import base64
+import functools
+import gzip
+import http.client
 import json
+import math
+import select
+import threading
+import time
+import urllib.parse
 import urllib.request
-import urllib.error
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Literal, Optional, Tuple
+
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# JSON codec used for request and response bodies. Decoders are bound
+# directly so the hot path does not go through a wrapper call.
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson rejects some values json accepts (e.g. integers
+            # beyond 64 bits); never fail where the plain install works
+            return _encode_json(obj).encode("utf-8")
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        return _encode_json(obj).encode("utf-8")
+
+    _loads = json.loads
+
+
+_JSON_CONTENT_TYPE = "application/json"
+_MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+Serializer = Literal["json", "msgpack"]
+Compression = Literal["zstd", "gzip"]
+
+# Request bodies up to this many bytes are sent uncompressed
+_COMPRESS_MIN_SIZE = 1024
+
+_ACCEPT_ENCODING = "zstd, gzip" if zstandard is not None else "gzip"
+
+# Maximum number of idle keep-alive connections kept per client
+_POOL_SIZE = 10
+
+# Methods that are safe to replay when a reused connection drops mid-request
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Task states after which a task no longer changes
+_FINAL_STATES = frozenset({"completed", "archived", "failed"})
+
+# Longest a single long-poll request asks the server to hold the connection
+_LONG_POLL_MAX = 60
+
+# Default and maximum interval between polls without long-poll support
+_POLL_INTERVAL = 0.5
+_POLL_INTERVAL_MAX = 5.0
+
+
+_msgpack: Any = None
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """Whether an idle connection was closed by the server.
+
+    An idle keep-alive socket should have nothing to read; if it is readable
+    the server either closed it or sent something unexpected.
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        if hasattr(select, "poll"):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return bool(poller.poll(0))
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _import_msgpack() -> Any:
+    """Import the optional msgpack package (once)."""
+    global _msgpack
+    if _msgpack is None:
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError(
+                "The msgpack serializer requires msgpack: pip install \"runqy-python[msgpack]\""
+            ) from None
+        _msgpack = msgpack
+    return _msgpack
+
+
+def _codec(serializer: str) -> Tuple[str, Callable[[Any], bytes]]:
+    """Return the (content type, encoder) pair for a serializer name."""
+    if serializer == "json":
+        return _JSON_CONTENT_TYPE, _dumps
+    elif serializer == "msgpack":
+        return _MSGPACK_CONTENT_TYPE, _import_msgpack().packb
+    else:
+        raise ValueError(f"Unsupported serializer: {serializer!r}")
+
+
+def _enqueue_framing(serializer: str, queue: str, timeout: int) -> Tuple[bytes, bytes]:
+    """Encode the constant parts of a /queue/add body.
+
+    Returns (prefix, suffix) such that prefix + encode(payload) + suffix
+    equals the encoding of {"queue": queue, "timeout": timeout, "data": payload}.
+    """
+    if serializer == "msgpack":
+        packb = _import_msgpack().packb
+        # 0x83: fixmap header for a map of three entries
+        prefix = b"\x83" + b"".join(packb(v) for v in ("queue", queue, "timeout", timeout, "data"))
+        return prefix, b""
+    return b'{"queue":' + _dumps(queue) + b',"timeout":' + _dumps(timeout) + b',"data":', b"}"
+
+
+def _resolve_compression(compression: Optional[str]) -> Optional[str]:
+    """Validate a compression name, using gzip when zstandard is missing."""
+    if compression is None or compression == "gzip":
+        return compression
+    elif compression == "zstd":
+        return "zstd" if zstandard is not None else "gzip"
+    else:
+        raise ValueError(f"Unsupported compression: {compression!r}")
+
+
+def _compress(compression: str, body: bytes) -> bytes:
+    """Compress a request body with the given Content-Encoding."""
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return gzip.compress(body, compresslevel=6)
+
+
+def _decompress(content_encoding: Optional[str], response_data: bytes) -> bytes:
+    """Undo the Content-Encoding of a response body."""
+    if not content_encoding or not response_data:
+        return response_data
+    content_encoding = content_encoding.strip().lower()
+    try:
+        if content_encoding == "gzip":
+            return gzip.decompress(response_data)
+        elif content_encoding == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompressobj().decompress(response_data)
+    except Exception as e:
+        raise RunqyError(f"Invalid {content_encoding} response body: {e}")
+
+    if content_encoding == "identity":
+        return response_data
+    raise RunqyError(f"Unsupported response Content-Encoding: {content_encoding}")
+
+
+def _decode_body(content_type: str, response_data: bytes) -> Dict[str, Any]:
+    """Decode a response body according to its Content-Type.
+
+    The body is handed to the decoder as the bytes read from the socket;
+    orjson, json and msgpack all accept bytes, so no str is built first.
+    """
+    if not response_data:
+        return {}
+    if content_type.startswith(_MSGPACK_CONTENT_TYPE):
+        return _import_msgpack().unpackb(response_data)
+    return _loads(response_data)
 
 
 class RunqyError(Exception):
-    """Base exception for runqy client errors."""
-    pass
+    """Base exception for runqy client errors.
+
+    Attributes:
+        status: HTTP status code of the server's error response, if any
+        body: Raw body of the server's error response, if any. It is only
+            decoded when the exception is formatted.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        body: Optional[bytes] = None,
+        status: Optional[int] = None
+    ):
+        super().__init__(message)
+        self.body = body
+        self.status = status
+
+    def __str__(self) -> str:
+        message = super().__str__()
+        if self.body is None:
+            return message
+        return f"{message}: {self.body.decode('utf-8', 'replace')}"
 
 
 class AuthenticationError(RunqyError):
@@ -22,6 +224,54 @@ class TaskNotFoundError(RunqyError):
     pass
 
 
+class _RawJSON:
+    """A task field value still holding the JSON string sent by the server."""
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _SlotField:
+    """Dataclass field with a None default, stored in the "_<name>" slot.
+
+    A slotted class cannot also have class attributes with the slot names,
+    which dataclass uses for defaults; this descriptor provides the default
+    instead.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return None  # Field default
+        return getattr(obj, self._attr)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        setattr(obj, self._attr, value)
+
+
+class _LazyJSONField(_SlotField):
+    """Dataclass field that decodes a _RawJSON value on first access.
+
+    Polling callers usually only look at state, so result and payload are
+    only parsed when read. Any other value is stored and returned as is.
+    """
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return None  # Field default
+        value = getattr(obj, self._attr)
+        if type(value) is _RawJSON:
+            try:
+                value = _loads(value.text)
+            except ValueError:
+                value = value.text  # Keep as string if not valid JSON
+            setattr(obj, self._attr, value)
+        return value
+
+
 @dataclass
 class TaskInfo:
     """Task information returned from server.
@@ -34,12 +284,104 @@ class TaskInfo:
         error: Error message (if failed)
         payload: Original task payload
     """
+    # No per-instance __dict__; pollers may hold many TaskInfo objects
+    __slots__ = ("task_id", "queue", "state", "_result", "_error", "_payload")
+
     task_id: str
     queue: str
     state: str
-    result: Optional[Any] = None
-    error: Optional[str] = None
-    payload: Optional[Dict[str, Any]] = None
+    result: Optional[Any] = _LazyJSONField()  # type: ignore[assignment]
+    error: Optional[str] = _SlotField()  # type: ignore[assignment]
+    payload: Optional[Dict[str, Any]] = _LazyJSONField()  # type: ignore[assignment]
+
+
+# Server field name -> TaskInfo attribute. The server reports tasks in
+# PascalCase; the lowercase spellings are accepted as well, but the
+# PascalCase value wins when both are present.
+_TASK_FIELDS = {
+    "ID": "task_id",
+    "Queue": "queue",
+    "State": "state",
+    "Result": "result",
+    "LastErr": "error",
+    "Payload": "payload",
+}
+_TASK_FIELDS_LOWERCASE = {
+    "id": "task_id",
+    "queue": "queue",
+    "state": "state",
+    "result": "result",
+    "last_err": "error",
+    "payload": "payload",
+}
+
+
+def _decode_task_info(info: Dict[str, Any], task_id: str = "") -> TaskInfo:
+    """Build a TaskInfo from a server task dict in a single pass over its keys."""
+    pascal: Dict[str, Any] = {}
+    lowercase: Dict[str, Any] = {}
+    for key, value in info.items():
+        name = _TASK_FIELDS.get(key)
+        if name is not None:
+            pascal[name] = value
+            continue
+        name = _TASK_FIELDS_LOWERCASE.get(key)
+        if name is not None:
+            lowercase[name] = value
+
+    fields: Dict[str, Any] = {"task_id": task_id, "queue": "", "state": "", **lowercase, **pascal}
+
+    # Result and payload may be JSON encoded as a string; TaskInfo
+    # decodes them when they are first accessed
+    for name in ("result", "payload"):
+        value = fields.get(name)
+        if isinstance(value, str) and value:
+            fields[name] = _RawJSON(value)
+
+    return TaskInfo(**fields)
+
+
+def _decode_task_response(response: Dict[str, Any], task_id: str) -> TaskInfo:
+    """Build a TaskInfo from the server response to /queue/{task_id}."""
+    # Only probe the lowercase key when the PascalCase one is missing
+    info = response.get("Info")
+    if info is None:
+        info = response.get("info", {})
+    return _decode_task_info(info, task_id)
+
+
+def _decode_task_batch(response: Dict[str, Any], task_ids: List[str]) -> List[TaskInfo]:
+    """Build TaskInfos from the server response to /queue/batch."""
+    infos = response.get("Tasks")
+    if infos is None:
+        infos = response.get("tasks", [])
+    if len(infos) != len(task_ids):
+        raise RunqyError(f"Batch response has {len(infos)} tasks for {len(task_ids)} task IDs")
+    return [_decode_task_info(info, task_id) for info, task_id in zip(infos, task_ids)]
+
+
+def _decode_enqueued(response: Dict[str, Any], queue: str, payload: Dict[str, Any]) -> TaskInfo:
+    """Build a TaskInfo from the server response to /queue/add."""
+    info = response.get("info", {})
+    return TaskInfo(
+        task_id=info.get("id", ""),
+        queue=info.get("queue", queue),
+        state=info.get("state", "pending"),
+        payload=payload,
+    )
+
+
+def _raise_for_status(status: int, response_data: bytes) -> None:
+    """Raise the matching client error for an HTTP error status."""
+    if status < 400:
+        return
+
+    if status == 401:
+        raise AuthenticationError("Authentication failed", response_data, status)
+    elif status == 404:
+        raise TaskNotFoundError("Task not found", response_data, status)
+    else:
+        raise RunqyError(f"HTTP {status}", response_data, status)
 
 
 class RunqyClient:
@@ -57,24 +399,192 @@ class RunqyClient:
         print(f"State: {result.state}, Result: {result.result}")
     """
 
-    def __init__(self, server_url: str, api_key: str, timeout: int = 30):
+    def __init__(
+        self,
+        server_url: str,
+        api_key: str,
+        timeout: int = 30,
+        serializer: Serializer = "json",
+        compression: Optional[Compression] = None
+    ):
         """Initialize the client.
 
+        Connections to the server are kept alive and reused across requests.
+        Call close() (or use the client as a context manager) to release them.
+
         Args:
             server_url: Base URL of the runqy server (e.g., "http://localhost:3000")
             api_key: API key for authentication
             timeout: Default request timeout in seconds
+            serializer: Wire format for request and response bodies, "json" or
+                "msgpack" (requires the msgpack package). The client switches
+                back to JSON if the server rejects MessagePack.
+            compression: Compress request bodies over 1 KiB with "zstd"
+                (requires the zstandard package, gzip is used without it) or
+                "gzip". Off by default; the server must accept the encoding.
+                Compressed responses are always accepted.
         """
         self.server_url = server_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
 
+        url = urllib.parse.urlsplit(self.server_url)
+        if url.scheme == "https":
+            self._connection_class = http.client.HTTPSConnection
+        elif url.scheme == "http":
+            self._connection_class = http.client.HTTPConnection
+        else:
+            raise ValueError(f"Unsupported server URL scheme: {server_url!r}")
+        # Always pass an explicit port: http.client would otherwise parse one
+        # out of the host, which breaks unbracketed IPv6 addresses
+        self._host = url.hostname
+        self._port = url.port or self._connection_class.default_port
+        self._path_prefix = url.path
+
+        # Honor HTTP(S)_PROXY / NO_PROXY like urllib does
+        self._proxy_headers: Dict[str, str] = {}
+        proxy = urllib.request.getproxies().get(url.scheme)
+        if proxy and not urllib.request.proxy_bypass(url.netloc):
+            self._proxy: Optional[urllib.parse.SplitResult] = urllib.parse.urlsplit(proxy)
+            if url.scheme == "http":
+                # Plain HTTP proxies expect the absolute URL as request target
+                self._path_prefix = self.server_url
+            if self._proxy.username is not None:
+                credentials = "%s:%s" % (
+                    urllib.parse.unquote(self._proxy.username),
+                    urllib.parse.unquote(self._proxy.password or ""),
+                )
+                self._proxy_headers["Proxy-Authorization"] = (
+                    "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                )
+        else:
+            self._proxy = None
+
+        self._auth = f"Bearer {api_key}"
+        self._set_serializer(serializer)
+        self.compression = _resolve_compression(compression)
+
+        # Set to False once the server turns out not to have /queue/batch
+        self._batch_supported = True
+
+        # Set to False once the server turns out not to have /queue/{id}/wait
+        self._wait_supported = True
+
+        self._idle: List[http.client.HTTPConnection] = []
+        self._idle_lock = threading.Lock()
+
+    def __enter__(self) -> "RunqyClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all idle connections held by the client."""
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _set_serializer(self, serializer: str) -> None:
+        """Select the encoder and content negotiation headers."""
+        content_type, self._encode = _codec(serializer)
+        self.serializer = serializer
+        self._headers = {
+            "Authorization": self._auth,
+            "Content-Type": content_type,
+            "Accept": content_type,
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        }
+        if self._connection_class is http.client.HTTPConnection:
+            # Plain HTTP requests go through the proxy as is; for HTTPS the
+            # credentials are only sent on the CONNECT request (see _connect)
+            self._headers.update(self._proxy_headers)
+
+    def _connect(self, timeout: float) -> http.client.HTTPConnection:
+        """Open a new connection to the server (or to its proxy)."""
+        if self._proxy is None:
+            return self._connection_class(self._host, self._port, timeout=timeout)
+        conn = self._connection_class(
+            self._proxy.hostname,
+            self._proxy.port or self._connection_class.default_port,
+            timeout=timeout,
+        )
+        if self._connection_class is http.client.HTTPSConnection:
+            conn.set_tunnel(self._host, self._port, headers=self._proxy_headers)
+        return conn
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """Send a request over a pooled connection.
+
+        Returns:
+            Response status, headers and body
+
+        Idle connections closed by the server are discarded before reuse. If
+        a reused connection still drops mid-request, idempotent requests are
+        retried once on a fresh connection; others (e.g. POST /queue/add)
+        are not, since the server may already have processed them.
+        """
+        conn = None
+        while conn is None:
+            with self._idle_lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            if _is_dropped(conn):
+                conn.close()
+                conn = None
+
+        while True:
+            reused = conn is not None
+            if conn is None:
+                conn = self._connect(timeout)
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+
+            try:
+                conn.request(method, url, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused or method not in _IDEMPOTENT_METHODS:
+                    raise
+                conn = None
+                continue
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            with self._idle_lock:
+                if len(self._idle) < _POOL_SIZE:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+        return resp.status, resp.headers, data
+
     def _request(
         self,
         method: str,
         path: str,
         data: Optional[Dict[str, Any]] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        body: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """Make an HTTP request to the server.
 
@@ -83,41 +593,47 @@ class RunqyClient:
             path: API path (e.g., "/queue/add")
             data: Request body data (for POST)
             timeout: Request timeout in seconds
+            body: data already encoded with the current serializer
 
         Returns:
-            Parsed JSON response
+            Parsed response
 
         Raises:
             AuthenticationError: If API key is invalid
             RunqyError: For other HTTP errors
         """
-        url = f"{self.server_url}{path}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        body = None
-        if data is not None:
-            body = json.dumps(data).encode("utf-8")
+        if body is None and data is not None:
+            body = self._encode(data)
 
-        req = urllib.request.Request(url, data=body, headers=headers, method=method)
+        request_headers = self._headers
+        compression = self.compression
+        if compression is not None and body is not None and len(body) > _COMPRESS_MIN_SIZE:
+            body = _compress(compression, body)
+            request_headers = {**request_headers, "Content-Encoding": compression}
+        else:
+            compression = None
 
         try:
-            with urllib.request.urlopen(req, timeout=timeout or self.timeout) as resp:
-                response_data = resp.read().decode("utf-8")
-                return json.loads(response_data) if response_data else {}
-        except urllib.error.HTTPError as e:
-            response_body = e.read().decode("utf-8") if e.fp else ""
-
-            if e.code == 401:
-                raise AuthenticationError(f"Authentication failed: {response_body}")
-            elif e.code == 404:
-                raise TaskNotFoundError(f"Task not found: {response_body}")
-            else:
-                raise RunqyError(f"HTTP {e.code}: {response_body}")
-        except urllib.error.URLError as e:
-            raise RunqyError(f"Connection error: {e.reason}")
+            status, headers, response_data = self._send(
+                method, self._path_prefix + path, body, request_headers, timeout or self.timeout
+            )
+        except (OSError, http.client.HTTPException) as e:
+            raise RunqyError(f"Connection error: {e}")
+
+        response_data = _decompress(headers.get("Content-Encoding"), response_data)
+
+        if status == 415:
+            # Server does not accept compressed bodies or MessagePack; fall
+            # back to plain bodies, then JSON, for good
+            if compression is not None:
+                self.compression = None
+                return self._request(method, path, data, timeout)
+            elif self.serializer != "json":
+                self._set_serializer("json")
+                return self._request(method, path, data, timeout)
+
+        _raise_for_status(status, response_data)
+        return _decode_body(headers.get("Content-Type", ""), response_data)
 
     def enqueue(
         self,
@@ -150,14 +666,49 @@ class RunqyClient:
         }
 
         response = self._request("POST", "/queue/add", data)
+        return _decode_enqueued(response, queue, payload)
 
-        info = response.get("info", {})
-        return TaskInfo(
-            task_id=info.get("id", ""),
-            queue=info.get("queue", queue),
-            state=info.get("state", "pending"),
-            payload=payload,
-        )
+    def bind_queue(
+        self,
+        queue: str,
+        timeout: int = 300
+    ) -> Callable[[Dict[str, Any]], TaskInfo]:
+        """Return an enqueue function specialized for one queue.
+
+        The queue name and timeout are encoded once; each call only
+        serializes the payload. Use this when enqueuing many tasks to the
+        same queue.
+
+        Args:
+            queue: Queue name (e.g., "inference.default")
+            timeout: Task execution timeout in seconds (default: 300)
+
+        Returns:
+            Function taking a payload and returning TaskInfo, like enqueue()
+
+        Example:
+            submit = client.bind_queue("inference.default")
+            tasks = [submit({"input": text}) for text in texts]
+        """
+        framing: Dict[str, Tuple[bytes, bytes]] = {}
+
+        def enqueue(payload: Dict[str, Any]) -> TaskInfo:
+            serializer, encode = self.serializer, self._encode
+            if serializer not in framing:
+                framing[serializer] = _enqueue_framing(serializer, queue, timeout)
+            prefix, suffix = framing[serializer]
+
+            data = {
+                "queue": queue,
+                "timeout": timeout,
+                "data": payload,
+            }
+            body = prefix + encode(payload) + suffix
+
+            response = self._request("POST", "/queue/add", data, body=body)
+            return _decode_enqueued(response, queue, payload)
+
+        return enqueue
 
     def get_task(self, task_id: str) -> TaskInfo:
         """Get task status and result.
@@ -179,32 +730,467 @@ class RunqyClient:
         """
         response = self._request("GET", f"/queue/{task_id}")
 
-        info = response.get("Info", response.get("info", {}))
+        return _decode_task_response(response, task_id)
+
+    def get_tasks(self, task_ids: List[str]) -> List[TaskInfo]:
+        """Get status and result of several tasks in one request.
+
+        Prefer this over calling get_task() in a loop when polling more than a
+        few tasks: all tasks are fetched in a single round-trip. If the server
+        has no batch endpoint, this falls back to one get_task() per ID.
+
+        Args:
+            task_ids: Task IDs returned from enqueue()
+
+        Returns:
+            TaskInfo for each task ID, in the same order
 
-        # Parse result if it's a string (JSON)
-        result = info.get("Result", info.get("result"))
-        if isinstance(result, str) and result:
+        Raises:
+            TaskNotFoundError: If a task doesn't exist
+            RunqyError: For other errors
+
+        Example:
+            tasks = client.get_tasks([t.task_id for t in enqueued])
+            done = [t for t in tasks if t.state == "completed"]
+        """
+        if not task_ids:
+            return []
+
+        if self._batch_supported:
             try:
-                result = json.loads(result)
-            except json.JSONDecodeError:
-                pass  # Keep as string if not valid JSON
+                response = self._request("POST", "/queue/batch", {"ids": task_ids})
+            except TaskNotFoundError:
+                # Either the endpoint or one of the tasks is missing; the
+                # per-task lookups raise in the latter case
+                tasks = [self.get_task(task_id) for task_id in task_ids]
+                self._batch_supported = False
+                return tasks
+            else:
+                return _decode_task_batch(response, task_ids)
+
+        return [self.get_task(task_id) for task_id in task_ids]
+
+    def wait_for_task(
+        self,
+        task_id: str,
+        timeout: float = 300,
+        poll: Optional[float] = None
+    ) -> TaskInfo:
+        """Wait for a task to finish.
+
+        Uses the server's long-poll endpoint (GET /queue/{task_id}/wait),
+        which answers as soon as the task changes state. Servers without it
+        are polled with get_task(), starting every `poll` seconds and backing
+        off up to every 5 seconds.
+
+        Args:
+            task_id: Task ID returned from enqueue()
+            timeout: Maximum time to wait in seconds (default: 300)
+            poll: Initial polling interval in seconds when long-polling is
+                unavailable (default: 0.5)
+
+        Returns:
+            TaskInfo in a final state (completed, archived or failed), or the
+            latest TaskInfo if the timeout expires first
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist
+            RunqyError: For other errors
+
+        Example:
+            task = client.enqueue("inference.default", {"input": "hello"})
+            result = client.wait_for_task(task.task_id, timeout=60)
+            if result.state == "completed":
+                print(f"Result: {result.result}")
+        """
+        deadline = time.monotonic() + timeout
+        interval = poll or _POLL_INTERVAL
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if self._wait_supported and remaining > 0:
+                wait = min(math.ceil(remaining), _LONG_POLL_MAX)
+                try:
+                    response = self._request(
+                        "GET", f"/queue/{task_id}/wait?timeout={wait}", timeout=wait + self.timeout
+                    )
+                except TaskNotFoundError:
+                    # Either the endpoint or the task is missing; get_task()
+                    # raises in the latter case
+                    task = self.get_task(task_id)
+                    self._wait_supported = False
+                else:
+                    task = _decode_task_response(response, task_id)
+            else:
+                task = self.get_task(task_id)
+
+            remaining = deadline - time.monotonic()
+            if task.state in _FINAL_STATES or remaining <= 0:
+                return task
+
+            if not self._wait_supported:
+                time.sleep(min(interval, remaining))
+                interval = max(interval, min(interval * 2, _POLL_INTERVAL_MAX))
+
+
+class AsyncRunqyClient:
+    """Asyncio client for interacting with runqy server.
+
+    Requires aiohttp (pip install "runqy-python[async]"). Requests share one
+    aiohttp session, so many enqueue/get_task calls can run concurrently.
+
+    Example:
+        async with AsyncRunqyClient("http://localhost:3000", api_key="your-api-key") as client:
+            tasks = await client.enqueue_many([
+                ("inference.default", {"input": "hello"}),
+                ("inference.default", {"input": "world"}),
+            ])
+            results = await asyncio.gather(*(client.get_task(t.task_id) for t in tasks))
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        api_key: str,
+        timeout: int = 30,
+        serializer: Serializer = "json",
+        compression: Optional[Compression] = None
+    ):
+        """Initialize the client.
+
+        Args:
+            server_url: Base URL of the runqy server (e.g., "http://localhost:3000")
+            api_key: API key for authentication
+            timeout: Default request timeout in seconds
+            serializer: Wire format for request and response bodies, "json" or
+                "msgpack" (see RunqyClient)
+            compression: Request body compression, "zstd" or "gzip" (see RunqyClient)
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "AsyncRunqyClient requires aiohttp: pip install \"runqy-python[async]\""
+            ) from None
+
+        self.server_url = server_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self._aiohttp = aiohttp
+        self._auth = f"Bearer {api_key}"
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._set_serializer(serializer)
+        self.compression = _resolve_compression(compression)
+
+        # Set to False once the server turns out not to have /queue/batch
+        self._batch_supported = True
+
+        # Set to False once the server turns out not to have /queue/{id}/wait
+        self._wait_supported = True
+
+    async def __aenter__(self) -> "AsyncRunqyClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _set_serializer(self, serializer: str) -> None:
+        """Select the encoder and content negotiation headers."""
+        content_type, self._encode = _codec(serializer)
+        self.serializer = serializer
+        self._headers = {"Content-Type": content_type, "Accept": content_type}
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, creating it inside the running event loop."""
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            self._session = aiohttp.ClientSession(
+                headers={"Authorization": self._auth},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+                trust_env=True,
+            )
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        body: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """Make an HTTP request to the server.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path (e.g., "/queue/add")
+            data: Request body data (for POST)
+            timeout: Request timeout in seconds
+            body: data already encoded with the current serializer
+
+        Returns:
+            Parsed response
+
+        Raises:
+            AuthenticationError: If API key is invalid
+            RunqyError: For other HTTP errors
+        """
+        session = self._get_session()
+
+        if body is None and data is not None:
+            body = self._encode(data)
+
+        request_headers = self._headers
+        compression = self.compression
+        if compression is not None and body is not None and len(body) > _COMPRESS_MIN_SIZE:
+            body = _compress(compression, body)
+            request_headers = {**request_headers, "Content-Encoding": compression}
+        else:
+            compression = None
+
+        # aiohttp decompresses responses itself
+        try:
+            async with session.request(
+                method,
+                self.server_url + path,
+                data=body,
+                headers=request_headers,
+                timeout=self._aiohttp.ClientTimeout(total=timeout or self.timeout),
+            ) as resp:
+                status = resp.status
+                content_type = resp.headers.get("Content-Type", "")
+                response_data = await resp.read()
+        except (self._aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise RunqyError(f"Connection error: {e}")
+
+        if status == 415:
+            # Server does not accept compressed bodies or MessagePack; fall
+            # back to plain bodies, then JSON, for good
+            if compression is not None:
+                self.compression = None
+                return await self._request(method, path, data, timeout)
+            elif self.serializer != "json":
+                self._set_serializer("json")
+                return await self._request(method, path, data, timeout)
+
+        _raise_for_status(status, response_data)
+        return _decode_body(content_type, response_data)
+
+    async def enqueue(
+        self,
+        queue: str,
+        payload: Dict[str, Any],
+        timeout: int = 300
+    ) -> TaskInfo:
+        """Enqueue a task to a queue.
+
+        Args:
+            queue: Queue name (e.g., "inference.default")
+            payload: Task payload data
+            timeout: Task execution timeout in seconds (default: 300)
 
-        # Parse payload if it's a string (JSON)
-        payload = info.get("Payload", info.get("payload"))
-        if isinstance(payload, str) and payload:
+        Returns:
+            TaskInfo with task_id and initial state
+
+        Raises:
+            AuthenticationError: If API key is invalid
+            RunqyError: For other errors
+        """
+        data = {
+            "queue": queue,
+            "timeout": timeout,
+            "data": payload,
+        }
+
+        response = await self._request("POST", "/queue/add", data)
+        return _decode_enqueued(response, queue, payload)
+
+    def bind_queue(
+        self,
+        queue: str,
+        timeout: int = 300
+    ) -> Callable[[Dict[str, Any]], Awaitable[TaskInfo]]:
+        """Return an enqueue coroutine function specialized for one queue.
+
+        See RunqyClient.bind_queue().
+
+        Args:
+            queue: Queue name (e.g., "inference.default")
+            timeout: Task execution timeout in seconds (default: 300)
+
+        Returns:
+            Coroutine function taking a payload and returning TaskInfo
+        """
+        framing: Dict[str, Tuple[bytes, bytes]] = {}
+
+        async def enqueue(payload: Dict[str, Any]) -> TaskInfo:
+            serializer, encode = self.serializer, self._encode
+            if serializer not in framing:
+                framing[serializer] = _enqueue_framing(serializer, queue, timeout)
+            prefix, suffix = framing[serializer]
+
+            data = {
+                "queue": queue,
+                "timeout": timeout,
+                "data": payload,
+            }
+            body = prefix + encode(payload) + suffix
+
+            response = await self._request("POST", "/queue/add", data, body=body)
+            return _decode_enqueued(response, queue, payload)
+
+        return enqueue
+
+    async def enqueue_many(
+        self,
+        items: Iterable[Tuple[str, Dict[str, Any]]],
+        timeout: int = 300
+    ) -> List[TaskInfo]:
+        """Enqueue several tasks concurrently.
+
+        Args:
+            items: (queue, payload) pairs
+            timeout: Task execution timeout in seconds (default: 300)
+
+        Returns:
+            TaskInfo for each item, in the same order
+
+        Example:
+            tasks = await client.enqueue_many(
+                ("inference.default", {"input": text}) for text in texts
+            )
+        """
+        return list(await asyncio.gather(
+            *(self.enqueue(queue, payload, timeout) for queue, payload in items)
+        ))
+
+    async def get_task(self, task_id: str) -> TaskInfo:
+        """Get task status and result.
+
+        Args:
+            task_id: Task ID returned from enqueue()
+
+        Returns:
+            TaskInfo with current state and result (if completed)
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist
+            RunqyError: For other errors
+        """
+        response = await self._request("GET", f"/queue/{task_id}")
+
+        return _decode_task_response(response, task_id)
+
+    async def get_tasks(self, task_ids: List[str]) -> List[TaskInfo]:
+        """Get status and result of several tasks in one request.
+
+        See RunqyClient.get_tasks(). Without a batch endpoint on the server,
+        the tasks are fetched concurrently instead.
+
+        Args:
+            task_ids: Task IDs returned from enqueue()
+
+        Returns:
+            TaskInfo for each task ID, in the same order
+
+        Raises:
+            TaskNotFoundError: If a task doesn't exist
+            RunqyError: For other errors
+        """
+        if not task_ids:
+            return []
+
+        if self._batch_supported:
             try:
-                payload = json.loads(payload)
-            except json.JSONDecodeError:
-                pass  # Keep as string if not valid JSON
-
-        return TaskInfo(
-            task_id=info.get("ID", info.get("id", task_id)),
-            queue=info.get("Queue", info.get("queue", "")),
-            state=info.get("State", info.get("state", "")),
-            result=result,
-            error=info.get("LastErr", info.get("last_err")),
-            payload=payload,
-        )
+                response = await self._request("POST", "/queue/batch", {"ids": task_ids})
+            except TaskNotFoundError:
+                # Either the endpoint or one of the tasks is missing; the
+                # per-task lookups raise in the latter case
+                tasks = list(await asyncio.gather(*(self.get_task(task_id) for task_id in task_ids)))
+                self._batch_supported = False
+                return tasks
+            else:
+                return _decode_task_batch(response, task_ids)
+
+        return list(await asyncio.gather(*(self.get_task(task_id) for task_id in task_ids)))
+
+    async def wait_for_task(
+        self,
+        task_id: str,
+        timeout: float = 300,
+        poll: Optional[float] = None
+    ) -> TaskInfo:
+        """Wait for a task to finish.
+
+        See RunqyClient.wait_for_task().
+
+        Args:
+            task_id: Task ID returned from enqueue()
+            timeout: Maximum time to wait in seconds (default: 300)
+            poll: Initial polling interval in seconds when long-polling is
+                unavailable (default: 0.5)
+
+        Returns:
+            TaskInfo in a final state (completed, archived or failed), or the
+            latest TaskInfo if the timeout expires first
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist
+            RunqyError: For other errors
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        interval = poll or _POLL_INTERVAL
+
+        while True:
+            remaining = deadline - loop.time()
+            if self._wait_supported and remaining > 0:
+                wait = min(math.ceil(remaining), _LONG_POLL_MAX)
+                try:
+                    response = await self._request(
+                        "GET", f"/queue/{task_id}/wait?timeout={wait}", timeout=wait + self.timeout
+                    )
+                except TaskNotFoundError:
+                    # Either the endpoint or the task is missing; get_task()
+                    # raises in the latter case
+                    task = await self.get_task(task_id)
+                    self._wait_supported = False
+                else:
+                    task = _decode_task_response(response, task_id)
+            else:
+                task = await self.get_task(task_id)
+
+            remaining = deadline - loop.time()
+            if task.state in _FINAL_STATES or remaining <= 0:
+                return task
+
+            if not self._wait_supported:
+                await asyncio.sleep(min(interval, remaining))
+                interval = max(interval, min(interval * 2, _POLL_INTERVAL_MAX))
+
+
+@functools.lru_cache(maxsize=16)
+def _client_for(server_url: str, api_key: str) -> RunqyClient:
+    """Return a shared client per (server_url, api_key) for enqueue()."""
+    return RunqyClient(server_url, api_key)
+
+
+def invalidate_cached_clients() -> None:
+    """Forget the clients cached by enqueue().
+
+    enqueue() keeps a client (and thus the API key and its open connections)
+    in memory per server URL and API key. Call this after rotating API keys;
+    the dropped clients' connections are closed when they are garbage
+    collected.
+    """
+    _client_for.cache_clear()
 
 
 def enqueue(
@@ -216,6 +1202,9 @@ def enqueue(
 ) -> TaskInfo:
     """Quick enqueue without creating a client instance.
 
+    Clients are cached per server URL and API key, so repeated calls reuse
+    connections. See invalidate_cached_clients().
+
     Args:
         queue: Queue name (e.g., "inference.default")
         payload: Task payload data
@@ -237,4 +1226,4 @@ def enqueue(
         )
         print(f"Task ID: {task.task_id}")
     """
-    return RunqyClient(server_url, api_key).enqueue(queue, payload, timeout)
+    return _client_for(server_url, api_key).enqueue(queue, payload, timeout)